@@ -1,18 +1,43 @@
 """
 Pure Python 2D platform "coin timer" game core.
 No pygame dependencies - designed to be wrapped by a Gymnasium environment.
+
+The per-tick physics for step lives in a scalar kernel (_step_core) that is
+compiled with numba when it is installed and runs as ordinary Python
+otherwise; numba is optional and only accelerates step. step_batch is
+separate, vectorised NumPy code and does not use the kernel.
 """
 
 import numpy as np
 from dataclasses import dataclass
-from typing import Tuple, Dict, Any
+from typing import Tuple, Union
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the physics kernel then runs interpreted
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
 
 
-# Action constants
+# Action constants (bit flags, combined with | for simultaneous actions)
 NOOP = 0
 LEFT = 1
 RIGHT = 2
-JUMP = 3
+JUMP = 4
+
+# Event bits returned by the physics kernel
+EV_PICKUP = 1
+EV_WIN = 2
+EV_TIMEOUT = 4
+EV_FALL = 8
+
+# Failure codes returned by step
+FAIL_NONE = 0
+FAIL_TIMEOUT = 1
+FAIL_FALL = 2
 
 
 @dataclass
@@ -41,7 +66,7 @@ class Config:
     coins_to_win: int = 10      # number of coins needed to win
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Agent state with position, velocity, and physics flags."""
     x: float
@@ -51,7 +76,7 @@ class Agent:
     grounded: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Coin:
     """Coin state with position and spawn index."""
     x: float
@@ -59,7 +84,7 @@ class Coin:
     spawn_index: int
 
 
-@dataclass
+@dataclass(slots=True)
 class State:
     """Complete game state."""
     agent: Agent
@@ -69,45 +94,159 @@ class State:
     last_coin_spawn_index: int
 
 
-def _platform_tops(cfg: Config) -> list[tuple[float, float, float, float]]:
+# Flat state layout: one row of STATE_SIZE float32 values per environment, so
+# N environments can be stored as a contiguous (N, STATE_SIZE) array. float32
+# is exact for the integer-valued fields and ample for pixel-scale physics,
+# and halves the footprint of large rollout buffers.
+IX_X = 0
+IX_Y = 1
+IX_VX = 2
+IX_VY = 3
+IX_GROUNDED = 4
+IX_COIN_X = 5
+IX_COIN_Y = 6
+IX_COIN_SPAWN = 7
+IX_COINS = 8
+IX_TIME_LEFT = 9
+IX_LAST_SPAWN = 10
+STATE_SIZE = 11
+
+
+def state_to_array(st: State) -> np.ndarray:
     """
-    Get platform rectangles as (x, y, width, height).
+    Pack a State into a flat float array using the IX_* layout.
+
+    Args:
+        st: Game state to pack
+
+    Returns:
+        float32 array of shape (STATE_SIZE,)
     """
-    return [
-        # Bottom platform split into 3 equal sections
-        (0, 320, 213, 40),      # Left section
-        (213, 320, 214, 40),    # Middle section  
-        (427, 320, 213, 40),    # Right section
-        
-        # Middle platform (center)
-        (200, 240, 240, 15),
-        
-        # Left upper platform (left arm)
-        (0, 160, 200, 15),
-        
-        # Right upper platform (right arm)
-        (440, 160, 200, 15),
+    return np.array([
+        st.agent.x, st.agent.y, st.agent.vx, st.agent.vy, st.agent.grounded,
+        st.coin.x, st.coin.y, st.coin.spawn_index,
+        st.coins_collected, st.time_left, st.last_coin_spawn_index,
+    ], dtype=np.float32)
+
+
+def state_from_array(arr: np.ndarray) -> State:
+    """
+    Unpack a flat IX_* layout array back into a State.
+
+    Args:
+        arr: Array of shape (STATE_SIZE,)
+
+    Returns:
+        Equivalent game state
+    """
+    (x, y, vx, vy, grounded, coin_x, coin_y, coin_spawn,
+     coins, time_left, last_spawn) = arr.tolist()
+    return State(
+        agent=Agent(x=x, y=y, vx=vx, vy=vy, grounded=bool(grounded)),
+        coin=Coin(x=coin_x, y=coin_y, spawn_index=int(coin_spawn)),
+        coins_collected=int(coins),
+        time_left=time_left,
+        last_coin_spawn_index=int(last_spawn)
+    )
+
+
+# Platform rectangles as (x, y, width, height), built once at import time
+_PLATFORMS = (
+    # Bottom platform split into 3 equal sections
+    (0, 320, 213, 40),      # Left section
+    (213, 320, 214, 40),    # Middle section
+    (427, 320, 213, 40),    # Right section
+
+    # Middle platform (center)
+    (200, 240, 240, 15),
+
+    # Left upper platform (left arm)
+    (0, 160, 200, 15),
+
+    # Right upper platform (right arm)
+    (440, 160, 200, 15),
+)
+
+
+# Platform rectangles as (left, top, right, bottom) edges, so collision tests
+# in the kernel are plain comparisons with no per-test additions
+_PLATFORM_EDGES = tuple((px, py, px + pw, py + ph) for px, py, pw, ph in _PLATFORMS)
+
+# Platform edges as a (num_platforms, 4) array for broadcast overlap tests
+_PLATS = np.array(_PLATFORM_EDGES, dtype=np.float32)
+
+
+def _build_x_buckets(bucket_size: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Build the x-axis broad phase table used by _step_core.
+    Entry b lists (in platform order) every platform overlapping the window
+    [b * bucket_size, (b + 2) * bucket_size), which covers any agent no wider
+    than one bucket whose left edge lies in bucket b. Two extra entries
+    follow: the second to last (_ALL_PLATFORMS_BUCKET) lists all platforms
+    and serves agents outside the table or wider than a bucket, and the last
+    (_NO_PLATFORMS_BUCKET) is empty, for when no platform can be reached.
+    Entries are padded with -1 to equal length so numba can index them.
+    """
+    n_buckets = -(-max(px + pw for px, _, pw, _ in _PLATFORMS) // bucket_size)
+    buckets = [
+        [i for i, (px, _, pw, _) in enumerate(_PLATFORMS)
+         if px < (b + 2) * bucket_size and px + pw > b * bucket_size]
+        for b in range(n_buckets)
     ]
+    buckets.append(list(range(len(_PLATFORMS))))
+    buckets.append([])
+    return tuple(tuple(b + [-1] * (len(_PLATFORMS) - len(b))) for b in buckets)
+
+
+_BUCKET_SHIFT = 6
+_BUCKET_SIZE = 1 << _BUCKET_SHIFT
+_X_BUCKETS = _build_x_buckets(_BUCKET_SIZE)
+_ALL_PLATFORMS_BUCKET = len(_X_BUCKETS) - 2
+_NO_PLATFORMS_BUCKET = len(_X_BUCKETS) - 1
+
+# Vertical extent shared by all platforms, for trivially rejecting the pass
+_PLATFORMS_TOP = min(py for _, py, _, _ in _PLATFORMS)
+_PLATFORMS_BOTTOM = max(py + ph for _, py, _, ph in _PLATFORMS)
+
+
+def _platform_tops(cfg: Config) -> tuple[tuple[float, float, float, float], ...]:
+    """
+    Get platform rectangles as (x, y, width, height).
+    The layout is fixed, so the shared module-level tuple is returned.
+    """
+    return _PLATFORMS
 
 
 def _sample_coin_spawn(cfg: Config, rng: np.random.Generator, last_spawn: int) -> int:
     """
     Sample a coin spawn index, ensuring it's different from the last one.
+    Draws uniformly from the other platforms by sampling one fewer index
+    and skipping over the last spawn.
     Returns index into platform list for spawn anchor.
     """
-    platforms = _platform_tops(cfg)
-    available_indices = [i for i in range(len(platforms)) if i != last_spawn]
-    return rng.choice(available_indices)
+    idx = int(rng.integers(0, len(_platform_tops(cfg)) - 1))
+    return idx + (idx >= last_spawn)
 
 
-def _rects_intersect(ax: float, ay: float, aw: float, ah: float,
-                    bx: float, by: float, bw: float, bh: float) -> bool:
+def _platform_overlaps(x: np.ndarray, y: np.ndarray, w: float, h: float) -> np.ndarray:
     """
-    Check if two axis-aligned rectangles intersect.
-    Returns True if rectangles overlap, False otherwise.
+    Test agent rectangles against every platform at once.
+    Positions may be scalars or arrays of shape (N,); the result has one
+    extra trailing axis with one column per platform.
+
+    Args:
+        x: Agent left edge(s)
+        y: Agent top edge(s)
+        w: Agent width
+        h: Agent height
+
+    Returns:
+        Boolean mask of shape (num_platforms,) or (N, num_platforms)
     """
-    return (ax < bx + bw and ax + aw > bx and 
-            ay < by + bh and ay + ah > by)
+    x = np.asarray(x)[..., None]
+    y = np.asarray(y)[..., None]
+    left, top, right, bottom = _PLATS[:, 0], _PLATS[:, 1], _PLATS[:, 2], _PLATS[:, 3]
+    return (x < right) & (x + w > left) & (y < bottom) & (y + h > top)
 
 
 def reset(cfg: Config, seed: int = 0) -> Tuple[State, np.random.Generator]:
@@ -124,10 +263,11 @@ def reset(cfg: Config, seed: int = 0) -> Tuple[State, np.random.Generator]:
     # Create deterministic RNG
     rng = np.random.default_rng(seed)
     
-    # Initialize agent at starting position (center of ground)
+    # Initialize agent at starting position (center of ground). Positions are
+    # floats from the start, so _step_core is only compiled for float arguments
     agent = Agent(
-        x=cfg.W // 2 - cfg.agent_size_w // 2,
-        y=320 - cfg.agent_size_h,  # on top of ground platform
+        x=float(cfg.W // 2 - cfg.agent_size_w // 2),
+        y=float(320 - cfg.agent_size_h),  # on top of ground platform
         vx=0.0,
         vy=0.0,
         grounded=True
@@ -135,13 +275,13 @@ def reset(cfg: Config, seed: int = 0) -> Tuple[State, np.random.Generator]:
     
     # Spawn first coin
     platforms = _platform_tops(cfg)
-    spawn_idx = rng.choice(len(platforms))
+    spawn_idx = int(rng.integers(0, len(platforms)))
     platform = platforms[spawn_idx]
     
     # Position coin slightly above platform center
     coin = Coin(
-        x=platform[0] + platform[2] // 2 - 8,  # 8 is half coin width (assuming 16px)
-        y=platform[1] - 20,  # 20 pixels above platform
+        x=float(platform[0] + platform[2] // 2 - 8),  # 8 is half coin width (assuming 16px)
+        y=float(platform[1] - 20),  # 20 pixels above platform
         spawn_index=spawn_idx
     )
     
@@ -157,147 +297,350 @@ def reset(cfg: Config, seed: int = 0) -> Tuple[State, np.random.Generator]:
     return state, rng
 
 
-def step(cfg: Config, st: State, actions: list[int], rng: np.random.Generator) -> Tuple[State, Dict[str, Any]]:
+@njit
+def _step_core(x: float, y: float, vx: float, vy: float, grounded: bool,
+               coin_x: float, coin_y: float, coins: int, time_left: float,
+               left: bool, right: bool, jump: bool,
+               params: tuple) -> tuple:
+    """
+    Physics kernel for one timestep, written against plain scalars so it can
+    be compiled with numba. Coin respawning needs the RNG and is left to the
+    caller, signalled through the EV_PICKUP bit.
+
+    Args:
+        x, y, vx, vy, grounded: Agent state
+        coin_x, coin_y: Current coin position
+        coins: Coins collected so far
+        time_left: Remaining time before this step
+        left, right, jump: Action flags for this step
+        params: Config constants, as built by _kernel_params
+
+    Returns:
+        Tuple of (x, y, vx, vy, grounded, coins, time_left, event_bits)
+    """
+    (W, gravity, death_y, dt, aw, ah, ax_ground, ax_air, vx_max,
+     jump_impulse, ground_friction, timer_budget, coins_to_win) = params
+
+    time_left -= dt
+    events = 0
+
+    # === INPUT PROCESSING ===
+    accel = ax_ground if grounded else ax_air
+    if left:
+        vx -= accel * dt
+    if right:
+        vx += accel * dt
+    horizontal_input = left or right
+
+    # Apply ground friction when not accelerating horizontally
+    vx *= ground_friction if (grounded and not horizontal_input) else 1.0
+
+    # Clamp horizontal velocity
+    vx = max(-vx_max, min(vx_max, vx))
+
+    # === HORIZONTAL MOVEMENT & COLLISION ===
+    # Move horizontally
+    x += vx * dt
+
+    # Screen boundary collision (prevent running off screen)
+    if x < 0:
+        x = 0.0
+        vx = 0.0
+    elif x > W - aw:
+        x = W - aw
+        vx = 0.0
+
+    # === GRAVITY & JUMPING ===
+    # Vertical motion does not depend on horizontal collisions, so it is
+    # integrated before the platform pass and both axes share one loop
+    # Apply gravity
+    vy += gravity * dt
+
+    # Handle jump input
+    if jump and grounded:
+        vy = jump_impulse
+
+    # Reset grounded flag - will be set if landing on top of platform
+    grounded = False
+
+    # === VERTICAL MOVEMENT ===
+    # Move vertically, keeping the pre-move position for side checks
+    prev_y = y
+    prev_vy = vy
+    y += vy * dt
+
+    # === PLATFORM COLLISION ===
+    # Broad phase: only platforms whose x-extent can reach the agent
+    bucket = int(x) >> _BUCKET_SHIFT
+    if bucket >= _ALL_PLATFORMS_BUCKET or aw > _BUCKET_SIZE:
+        bucket = _ALL_PLATFORMS_BUCKET
+
+    # Early out: the vertical sweep passes entirely above or below every platform
+    if ((y + ah <= _PLATFORMS_TOP and prev_y + ah <= _PLATFORMS_TOP) or
+            (y >= _PLATFORMS_BOTTOM and prev_y >= _PLATFORMS_BOTTOM)):
+        bucket = _NO_PLATFORMS_BUCKET
+
+    # Each platform's x-overlap test is shared between the side check (at
+    # the pre-move y) and the landing/ceiling check (at the new y)
+    unresolved_x = x
+    unresolved_vx = vx
+    side_hit = False
+    for i in _X_BUCKETS[bucket]:
+        if i < 0:
+            break
+        p_left, p_top, p_right, p_bottom = _PLATFORM_EDGES[i]
+        if x < p_right and x + aw > p_left:
+            if prev_y < p_bottom and prev_y + ah > p_top:
+                side_hit = True
+                break
+            if y < p_bottom and y + ah > p_top:
+                if vy > 0:  # Falling down, hit top of platform
+                    y = p_top - ah
+                    vy = 0.0
+                    grounded = True
+                else:  # Moving up, hit bottom of platform
+                    y = p_bottom
+                    vy = 0.0
+
+    if side_hit:
+        # A side hit moves x, invalidating both the broad phase and any
+        # vertical checks already made, so resolve each axis in full
+        x = unresolved_x
+        vx = unresolved_vx
+        y = prev_y + prev_vy * dt
+        vy = prev_vy
+        grounded = False
+
+        # Resolve horizontal collisions with platforms
+        for p_left, p_top, p_right, p_bottom in _PLATFORM_EDGES:
+            if x < p_right and x + aw > p_left and prev_y < p_bottom and prev_y + ah > p_top:
+                # Collision detected - resolve based on approach direction
+                if vx > 0:  # Moving right, hit left side
+                    x = p_left - aw
+                else:  # Moving left, hit right side
+                    x = p_right
+                vx = 0.0
+
+        # Resolve vertical collisions with platforms
+        for p_left, p_top, p_right, p_bottom in _PLATFORM_EDGES:
+            if x < p_right and x + aw > p_left and y < p_bottom and y + ah > p_top:
+                if vy > 0:  # Falling down, hit top of platform
+                    y = p_top - ah
+                    vy = 0.0
+                    grounded = True
+                else:  # Moving up, hit bottom of platform
+                    y = p_bottom
+                    vy = 0.0
+
+    # === COIN PICKUP LOGIC ===
+    # Check if agent collected the coin
+    coin_size = 16  # Assume 16x16 coin
+    if (x < coin_x + coin_size and x + aw > coin_x and
+            y < coin_y + coin_size and y + ah > coin_y):
+        events |= EV_PICKUP
+        coins += 1
+        time_left = timer_budget  # Reset timer
+
+    # === TIMER & TERMINATION LOGIC ===
+    # Check win condition
+    if coins >= coins_to_win:
+        events |= EV_WIN
+
+    # Check fail conditions
+    if time_left <= 0:
+        events |= EV_TIMEOUT
+    elif y >= death_y:
+        events |= EV_FALL
+
+    return x, y, vx, vy, grounded, coins, time_left, events
+
+
+def _kernel_params(cfg: Config) -> tuple:
+    """
+    Flatten the Config constants used by _step_core into a plain tuple.
+    """
+    return (float(cfg.W), cfg.gravity, cfg.death_y, cfg.dt,
+            float(cfg.agent_size_w), float(cfg.agent_size_h),
+            cfg.ax_ground, cfg.ax_air, cfg.vx_max, cfg.jump_impulse,
+            cfg.ground_friction, cfg.timer_budget, cfg.coins_to_win)
+
+
+def step(cfg: Config, st: State, actions: Union[int, list[int]], rng: np.random.Generator) -> Tuple[State, bool, bool, int]:
     """
     Execute one physics timestep and return updated state and events.
+    The state is updated in place and returned; callers that need to keep
+    the previous state must copy it before stepping.
     
     Args:
         cfg: Game configuration
-        st: Current game state
-        actions: List of actions to take (NOOP, LEFT, RIGHT, JUMP)
+        st: Current game state (mutated)
+        actions: Bitmask of actions (e.g. LEFT | JUMP); a list of
+                 action constants is also accepted and OR-ed together
         rng: Random number generator
         
     Returns:
-        Tuple of (new_state, events_dict)
+        Tuple of (st, pickup, win, fail), where fail is one of
+        FAIL_NONE, FAIL_TIMEOUT or FAIL_FALL
     """
-    # Create new state by copying current
-    new_agent = Agent(
-        x=st.agent.x,
-        y=st.agent.y,
-        vx=st.agent.vx,
-        vy=st.agent.vy,
-        grounded=st.agent.grounded
-    )
-    
-    new_coin = Coin(
-        x=st.coin.x,
-        y=st.coin.y,
-        spawn_index=st.coin.spawn_index
-    )
+    if isinstance(actions, (int, np.integer)):
+        mask = actions
+    else:
+        # Backward compatibility: fold a list of actions into a bitmask
+        mask = NOOP
+        for action in actions:
+            mask |= action
+    left, right, jump = (mask & LEFT) != 0, (mask & RIGHT) != 0, (mask & JUMP) != 0
     
-    new_state = State(
-        agent=new_agent,
-        coin=new_coin,
-        coins_collected=st.coins_collected,
-        time_left=st.time_left - cfg.dt,
-        last_coin_spawn_index=st.last_coin_spawn_index
+    agent = st.agent
+    coin = st.coin
+    (agent.x, agent.y, agent.vx, agent.vy, agent.grounded,
+     st.coins_collected, st.time_left, bits) = _step_core(
+        agent.x, agent.y, agent.vx, agent.vy, agent.grounded,
+        coin.x, coin.y, st.coins_collected, st.time_left,
+        left, right, jump,
+        _kernel_params(cfg)
     )
     
-    events = {"pickup": False, "win": False, "fail": None}
+    if bits & EV_PICKUP:
+        # Spawn new coin at different location
+        platforms = _platform_tops(cfg)
+        new_spawn_idx = _sample_coin_spawn(cfg, rng, st.last_coin_spawn_index)
+        new_platform = platforms[new_spawn_idx]
+        
+        coin.x = float(new_platform[0] + new_platform[2] // 2 - 8)
+        coin.y = float(new_platform[1] - 20)
+        coin.spawn_index = new_spawn_idx
+        st.last_coin_spawn_index = new_spawn_idx
     
-    # === INPUT PROCESSING ===
-    # Process all actions simultaneously
-    horizontal_input = False
+    fail = FAIL_NONE
+    if bits & EV_TIMEOUT:
+        fail = FAIL_TIMEOUT
+    elif bits & EV_FALL:
+        fail = FAIL_FALL
     
-    for action in actions:
-        if action == LEFT:
-            accel = cfg.ax_ground if new_agent.grounded else cfg.ax_air
-            new_agent.vx -= accel * cfg.dt
-            horizontal_input = True
-        elif action == RIGHT:
-            accel = cfg.ax_ground if new_agent.grounded else cfg.ax_air
-            new_agent.vx += accel * cfg.dt
-            horizontal_input = True
+    return st, bool(bits & EV_PICKUP), bool(bits & EV_WIN), fail
+
+
+def step_batch(cfg: Config, states: np.ndarray, actions: np.ndarray,
+               rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Execute one physics timestep for N environments at once.
+    Each stage of step is applied as array operations over axis 0, so the
+    Python overhead per call is independent of N.
     
-    # Apply ground friction when not accelerating horizontally
-    if new_agent.grounded and not horizontal_input:
-        new_agent.vx *= cfg.ground_friction
+    Args:
+        cfg: Game configuration
+        states: Array of shape (N, STATE_SIZE) in the IX_* layout
+        actions: Array of shape (N,) of action bitmasks, or (N, A) of
+                 action constants that are OR-ed per environment
+        rng: Random number generator (shared by all environments)
+        
+    Returns:
+        Tuple of (new_states, event_bits), where new_states is a float32
+        copy of states advanced one tick and event_bits has shape (N,)
+        and holds EV_* flags for each environment
+
+    One tick matches step to within float32 rounding, but rollouts are not
+    bit-for-bit reproductions of scalar ones: when an agent ends a move
+    exactly on a boundary (the x = 0 and x = W - aw wall clamps, platform
+    edges), float32 and float64 can round to opposite sides of it. The
+    trajectories then separate and later events differ, so compare batched
+    and scalar rollouts statistically rather than tick by tick.
+    """
+    # Config constants are read once into locals
+    dt = cfg.dt
+    aw, ah = cfg.agent_size_w, cfg.agent_size_h
+    W = cfg.W
+    ax_ground, ax_air = cfg.ax_ground, cfg.ax_air
+    ground_friction, vx_max = cfg.ground_friction, cfg.vx_max
+    gravity, jump_impulse = cfg.gravity, cfg.jump_impulse
+    timer_budget, coins_to_win, death_y = cfg.timer_budget, cfg.coins_to_win, cfg.death_y
     
-    # Clamp horizontal velocity
-    new_agent.vx = np.clip(new_agent.vx, -cfg.vx_max, cfg.vx_max)
+    new_states = np.array(states, dtype=np.float32)
+    if len(new_states) == 0:
+        # Nothing to step; the action reshape below needs at least one row
+        return new_states, np.zeros(0, dtype=np.int32)
     
-    # === HORIZONTAL MOVEMENT & COLLISION ===
-    # Move horizontally
-    new_agent.x += new_agent.vx * cfg.dt
+    masks = np.bitwise_or.reduce(np.asarray(actions).reshape(len(new_states), -1), axis=1)
+    left = (masks & LEFT) != 0
+    right = (masks & RIGHT) != 0
+    jump = (masks & JUMP) != 0
     
-    # Screen boundary collision (prevent running off screen)
-    if new_agent.x < 0:
-        new_agent.x = 0
-        new_agent.vx = 0
-    elif new_agent.x > cfg.W - cfg.agent_size_w:
-        new_agent.x = cfg.W - cfg.agent_size_w
-        new_agent.vx = 0
+    x = new_states[:, IX_X].copy()
+    y = new_states[:, IX_Y].copy()
+    vx = new_states[:, IX_VX].copy()
+    vy = new_states[:, IX_VY].copy()
+    grounded = new_states[:, IX_GROUNDED] != 0
+    coins = new_states[:, IX_COINS]
+    time_left = new_states[:, IX_TIME_LEFT] - dt
     
-    # Resolve horizontal collisions with platforms
-    platforms = _platform_tops(cfg)
-    for platform in platforms:
-        if _rects_intersect(new_agent.x, new_agent.y, cfg.agent_size_w, cfg.agent_size_h,
-                           platform[0], platform[1], platform[2], platform[3]):
-            # Collision detected - resolve based on approach direction
-            if new_agent.vx > 0:  # Moving right, hit left side
-                new_agent.x = platform[0] - cfg.agent_size_w
-            else:  # Moving left, hit right side
-                new_agent.x = platform[0] + platform[2]
-            new_agent.vx = 0
+    # === INPUT PROCESSING ===
+    # Constants are cast so np.where does not promote the arrays to float64
+    accel = np.where(grounded, np.float32(ax_ground), np.float32(ax_air))
+    vx = np.where(left, vx - accel * dt, vx)
+    vx = np.where(right, vx + accel * dt, vx)
+    friction = np.where(grounded & ~(left | right), np.float32(ground_friction), np.float32(1.0))
+    vx = vx * friction
+    vx = np.clip(vx, -vx_max, vx_max)
     
-    # === GRAVITY & JUMPING ===
-    # Apply gravity
-    new_agent.vy += cfg.gravity * cfg.dt
+    # === HORIZONTAL MOVEMENT & COLLISION ===
+    x += vx * dt
+    hit_left = x < 0
+    hit_right = ~hit_left & (x > W - aw)
+    x[hit_left] = 0.0
+    x[hit_right] = W - aw
+    vx[hit_left | hit_right] = 0.0
     
-    # Handle jump input
-    for action in actions:
-        if action == JUMP and new_agent.grounded:
-            new_agent.vy = cfg.jump_impulse
-            break  # Only jump once per frame
+    # Platforms are resolved one at a time, in order, exactly as in step;
+    # the broadcast test only skips the pass when nothing overlaps
+    if _platform_overlaps(x, y, aw, ah).any():
+        for p_left, p_top, p_right, p_bottom in _PLATS:
+            hit = (x < p_right) & (x + aw > p_left) & (y < p_bottom) & (y + ah > p_top)
+            x = np.where(hit, np.where(vx > 0, p_left - aw, p_right), x)
+            vx = np.where(hit, 0.0, vx)
     
-    # Reset grounded flag - will be set if landing on top of platform
-    new_agent.grounded = False
+    # === GRAVITY & JUMPING ===
+    vy += gravity * dt
+    vy = np.where(jump & grounded, jump_impulse, vy)
+    grounded = np.zeros(len(new_states), dtype=bool)
     
     # === VERTICAL MOVEMENT & COLLISION ===
-    # Move vertically
-    new_agent.y += new_agent.vy * cfg.dt
-    
-    # Resolve vertical collisions with platforms
-    for platform in platforms:
-        if _rects_intersect(new_agent.x, new_agent.y, cfg.agent_size_w, cfg.agent_size_h,
-                           platform[0], platform[1], platform[2], platform[3]):
-            # Collision detected - resolve based on approach direction
-            if new_agent.vy > 0:  # Falling down, hit top of platform
-                new_agent.y = platform[1] - cfg.agent_size_h
-                new_agent.vy = 0
-                new_agent.grounded = True
-            else:  # Moving up, hit bottom of platform
-                new_agent.y = platform[1] + platform[3]
-                new_agent.vy = 0
+    y += vy * dt
+    if _platform_overlaps(x, y, aw, ah).any():
+        for p_left, p_top, p_right, p_bottom in _PLATS:
+            hit = (x < p_right) & (x + aw > p_left) & (y < p_bottom) & (y + ah > p_top)
+            falling = vy > 0
+            y = np.where(hit, np.where(falling, p_top - ah, p_bottom), y)
+            grounded |= hit & falling
+            vy = np.where(hit, 0.0, vy)
     
     # === COIN PICKUP LOGIC ===
-    # Check if agent collected the coin
     coin_size = 16  # Assume 16x16 coin
-    if _rects_intersect(new_agent.x, new_agent.y, cfg.agent_size_w, cfg.agent_size_h,
-                       new_coin.x, new_coin.y, coin_size, coin_size):
-        events["pickup"] = True
-        new_state.coins_collected += 1
-        new_state.time_left = cfg.timer_budget  # Reset timer
-        
-        # Spawn new coin at different location
-        platforms = _platform_tops(cfg)
-        new_spawn_idx = _sample_coin_spawn(cfg, rng, new_state.last_coin_spawn_index)
+    coin_x = new_states[:, IX_COIN_X]
+    coin_y = new_states[:, IX_COIN_Y]
+    pickup = ((x < coin_x + coin_size) & (x + aw > coin_x) &
+              (y < coin_y + coin_size) & (y + ah > coin_y))
+    coins = coins + pickup
+    time_left = np.where(pickup, timer_budget, time_left)
+    
+    platforms = _platform_tops(cfg)
+    for i in np.flatnonzero(pickup):
+        new_spawn_idx = _sample_coin_spawn(cfg, rng, int(new_states[i, IX_LAST_SPAWN]))
         new_platform = platforms[new_spawn_idx]
-        
-        new_coin.x = new_platform[0] + new_platform[2] // 2 - 8
-        new_coin.y = new_platform[1] - 20
-        new_coin.spawn_index = new_spawn_idx
-        new_state.last_coin_spawn_index = new_spawn_idx
+        new_states[i, IX_COIN_X] = new_platform[0] + new_platform[2] // 2 - 8
+        new_states[i, IX_COIN_Y] = new_platform[1] - 20
+        new_states[i, IX_COIN_SPAWN] = new_spawn_idx
+        new_states[i, IX_LAST_SPAWN] = new_spawn_idx
     
     # === TIMER & TERMINATION LOGIC ===
-    # Check win condition
-    if new_state.coins_collected >= cfg.coins_to_win:
-        events["win"] = True
-    
-    # Check fail conditions
-    if new_state.time_left <= 0:
-        events["fail"] = "timeout"
-    elif new_agent.y >= cfg.death_y:
-        events["fail"] = "fall"
+    events = np.where(pickup, EV_PICKUP, 0) | np.where(coins >= coins_to_win, EV_WIN, 0)
+    events |= np.where(time_left <= 0, EV_TIMEOUT, np.where(y >= death_y, EV_FALL, 0))
     
-    return new_state, events
+    new_states[:, IX_X] = x
+    new_states[:, IX_Y] = y
+    new_states[:, IX_VX] = vx
+    new_states[:, IX_VY] = vy
+    new_states[:, IX_GROUNDED] = grounded
+    new_states[:, IX_COINS] = coins
+    new_states[:, IX_TIME_LEFT] = time_left
+    return new_states, events.astype(np.int32)
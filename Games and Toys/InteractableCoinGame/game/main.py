@@ -5,7 +5,7 @@ Handles pygame initialization, event processing, and game state management.
 
 import sys
 import pygame
-from core import Config, reset, step, NOOP
+from core import Config, reset, step, FAIL_TIMEOUT, FAIL_FALL
 from render import draw, get_actions_from_keys
 
 
@@ -47,24 +47,21 @@ def main():
         
         # Game logic (only if not game over)
         if not game_over:
-            # Get actions from keyboard input
+            # Get actions from keyboard input (NOOP when no keys are held,
+            # so physics always runs)
             actions = get_actions_from_keys(state)
             
-            # Always run physics step (even with NOOP if no actions)
-            if not actions:
-                actions = [NOOP]  # Ensure physics always runs
-            
             # Execute game step with all actions
-            state, events = step(cfg, state, actions, rng)
+            state, pickup, win, fail = step(cfg, state, actions, rng)
             
             # Handle game events
-            if events["win"]:
+            if win:
                 game_message = "WIN! Press R to restart."
                 game_over = True
-            elif events["fail"]:
-                if events["fail"] == "timeout":
+            elif fail:
+                if fail == FAIL_TIMEOUT:
                     game_message = "FAIL (timeout). Press R to restart."
-                elif events["fail"] == "fall":
+                elif fail == FAIL_FALL:
                     game_message = "FAIL (fell). Press R to restart."
                 game_over = True
         
@@ -16,29 +16,29 @@ YELLOW = (255, 255, 0)
 GREEN = (0, 255, 0)
 
 
-def get_actions_from_keys(st: State) -> list[int]:
+def get_actions_from_keys(st: State) -> int:
     """
     Map keyboard input to game actions.
-    Returns a list of simultaneous actions.
+    Returns a bitmask of simultaneous actions.
     
     Args:
         st: Current game state
         
     Returns:
-        List of action constants (can be empty, or contain LEFT/RIGHT/JUMP)
+        Action bitmask (NOOP, or any combination of LEFT/RIGHT/JUMP)
     """
     keys = pygame.key.get_pressed()
-    actions = []
+    actions = NOOP
     
     # Horizontal movement
     if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-        actions.append(LEFT)
+        actions |= LEFT
     if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-        actions.append(RIGHT)
+        actions |= RIGHT
     
     # Jump (only if grounded)
     if (keys[pygame.K_SPACE] or keys[pygame.K_w] or keys[pygame.K_UP]) and st.agent.grounded:
-        actions.append(JUMP)
+        actions |= JUMP
     
     return actions
 
@@ -46,7 +46,7 @@ def get_actions_from_keys(st: State) -> list[int]:
 def get_action_from_keys(st: State) -> int:
     """
     Legacy function for single action input.
-    Returns the first action from get_actions_from_keys.
+    Returns the lowest set action bit from get_actions_from_keys.
     
     Args:
         st: Current game state
@@ -55,7 +55,7 @@ def get_action_from_keys(st: State) -> int:
         Action constant (NOOP, LEFT, RIGHT, JUMP)
     """
     actions = get_actions_from_keys(st)
-    return actions[0] if actions else NOOP
+    return actions & -actions
 
 
 def draw_platforms(screen: pygame.Surface, cfg: Config) -> None:
@@ -1,16 +1,86 @@
 from game.core import Config, reset, step, LEFT, RIGHT, JUMP, NOOP
+from game.core import (step_batch, state_to_array, state_from_array, STATE_SIZE,
+                       EV_PICKUP, EV_WIN, EV_TIMEOUT, EV_FALL, FAIL_TIMEOUT, FAIL_FALL,
+                       IX_X, IX_Y, IX_VX, IX_VY, IX_GROUNDED, IX_COIN_X, IX_COIN_Y,
+                       IX_COINS, IX_TIME_LEFT, _platform_tops)
+import math
+import random
 import numpy as np
 
 cfg = Config()
 st, rng = reset(cfg, seed=0)
 
-# random roll for 300 steps
+# random roll for up to 10000 steps, stopping when the episode ends
 for _ in range(10000):
-    a = np.random.randint(0, 4)
-    st, ev = step(cfg, st, int(a), rng)
-    assert np.isfinite([st.agent.x, st.agent.y, st.agent.vx, st.agent.vy]).all()
-    if ev["pickup"]:
+    a = random.randrange(8)  # any combination of LEFT | RIGHT | JUMP
+    st, pickup, win, fail = step(cfg, st, a, rng)
+    assert all(math.isfinite(v) for v in (st.agent.x, st.agent.y, st.agent.vx, st.agent.vy))
+    if pickup:
         print("pickup; time_left reset:", st.time_left)
-    if ev["win"] or ev["fail"]:
-        print("end:", ev)
-        break
\ No newline at end of file
+    if win or fail:
+        print("end:", {"win": win, "fail": fail})
+        break
+
+# step_batch must agree with per-environment step. Every tick both start from
+# the same float32 states, so each tick compares like with like and nothing
+# carries over between ticks. Coin respawns draw from one shared rng in
+# step_batch, so respawned coin positions are not compared. The agent's position
+# and velocity, events, coins and timer must match within float32 tolerance,
+# except where the agent ends a move exactly on an edge along that axis
+N, T = 64, 300
+EPS = 1e-3
+AW, AH = cfg.agent_size_w, cfg.agent_size_h
+EDGES = [(0, -1e9, 0, 1e9), (cfg.W, -1e9, cfg.W, 1e9)] + [
+    (px, py, px + pw, py + ph) for px, py, pw, ph in _platform_tops(cfg)]
+
+
+def near_edges(row):
+    """Whether the agent's x and y extents touch a wall, platform or coin edge
+    to within EPS, where float32 and float64 may round to opposite sides of
+    it (see step_batch). Returns (near_x, near_y)."""
+    x, y = float(row[IX_X]), float(row[IX_Y])
+    coin_x, coin_y = float(row[IX_COIN_X]), float(row[IX_COIN_Y])
+    boxes = EDGES + [(coin_x, coin_y, coin_x + 16, coin_y + 16)]
+    near_x = any(min(abs(x + AW - left), abs(x - right)) < EPS for left, _, right, _ in boxes)
+    near_y = any(min(abs(y + AH - top), abs(y - bottom)) < EPS for _, top, _, bottom in boxes)
+    return near_x, near_y
+
+
+states = np.stack([state_to_array(reset(cfg, seed=i)[0]) for i in range(N)])
+batch_rng, scalar_rng = np.random.default_rng(5), np.random.default_rng(5)
+action_rng = random.Random(0)
+ambiguous = 0
+for _ in range(T):
+    actions = np.array([action_rng.randrange(8) for _ in range(N)])
+    new_states, events = step_batch(cfg, states, actions, batch_rng)
+    assert new_states.shape == (N, STATE_SIZE) and new_states.dtype == np.float32
+    assert events.shape == (N,) and events.dtype == np.int32
+    for i in range(N):
+        st_i, pickup, win, fail = step(cfg, state_from_array(states[i]), int(actions[i]), scalar_rng)
+        bits = ((EV_PICKUP if pickup else 0) | (EV_WIN if win else 0) |
+                (EV_TIMEOUT if fail == FAIL_TIMEOUT else 0) | (EV_FALL if fail == FAIL_FALL else 0))
+        expected = state_to_array(st_i)
+        got = new_states[i]
+        # Positions always agree: an edge tie only changes how it is resolved
+        assert np.allclose(got[[IX_X, IX_Y]], expected[[IX_X, IX_Y]], atol=EPS), (i, got, expected)
+        vx_ok = abs(got[IX_VX] - expected[IX_VX]) < EPS
+        vy_ok = abs(got[IX_VY] - expected[IX_VY]) < EPS and got[IX_GROUNDED] == expected[IX_GROUNDED]
+        rest_ok = (bits == events[i] and got[IX_COINS] == expected[IX_COINS] and
+                   abs(got[IX_TIME_LEFT] - expected[IX_TIME_LEFT]) < 1e-5)
+        if not (vx_ok and vy_ok and rest_ok):
+            # Only an agent ending exactly on an edge along the differing
+            # axis may resolve it differently
+            near = [near_edges(r) for r in (expected, got)]
+            near_x, near_y = any(n[0] for n in near), any(n[1] for n in near)
+            assert (vx_ok or near_x) and (vy_ok or near_y) and (rest_ok or near_x or near_y), (
+                i, states[i], got, expected, bits, events[i])
+            ambiguous += 1
+        # Restart finished episodes so every tick exercises live states
+        if events[i] & (EV_WIN | EV_TIMEOUT | EV_FALL):
+            new_states[i] = state_to_array(reset(cfg, seed=N + i)[0])
+    states = new_states
+print("step_batch vs step:", ambiguous, "of", N * T, "environment-ticks resolved an edge tie differently")
+
+# An empty batch steps to empty outputs
+empty_states, empty_events = step_batch(cfg, np.zeros((0, STATE_SIZE), dtype=np.float32), np.zeros(0, dtype=int), batch_rng)
+assert empty_states.shape == (0, STATE_SIZE) and empty_events.shape == (0,)
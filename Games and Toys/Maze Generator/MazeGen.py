@@ -15,8 +15,120 @@ Features:
 
 import tkinter as tk
 from tkinter import Canvas, Button, Label, Scale, Frame
+import itertools
 import random
-import time
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; the fast carver then runs interpreted
+    _HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Cell state flags packed into one uint8 per cell: bit 0 = path, bit 1 =
+# visited. Carved walls are path only; cells reached by the search are both.
+_PATH = 1
+_VISITED = 2
+_CARVED = _PATH | _VISITED
+
+# bytes.translate table for print_maze: '#' for walls, ' ' for paths
+_PRINT_TABLE = bytes(ord(' ') if i & _PATH else ord('#') for i in range(256))
+
+# Carving directions (dx, dy), indexed by a permutation of range(4):
+# right, down, left, up. _DIRECTIONS holds the same rows as plain tuples for
+# the interpreted carvers, where NumPy scalar arithmetic would be slower.
+_DIRS = np.array([[0, 2], [2, 0], [0, -2], [-2, 0]], dtype=np.int32)
+_DIRECTIONS = tuple(tuple(d) for d in _DIRS.tolist())
+
+# All 24 orderings of _DIRECTIONS; a shuffle is one randrange(24) lookup
+_PERMS4 = list(itertools.permutations(_DIRECTIONS))
+
+# RGB colours used when rendering the maze as an image
+_WALL_RGB = (0, 0, 0)          # black
+_PATH_RGB = (255, 255, 255)    # white
+_OUTLINE_RGB = (190, 190, 190) # Tk 'gray', the path cell outline
+
+
+def _cell_tiles(cell_size):
+    """
+    Build the pixel blocks used to render one maze cell.
+    
+    Args:
+        cell_size (int): Size of each cell in pixels
+        
+    Returns:
+        np.ndarray: (2, cell_size, cell_size, 3) uint8 array indexed by cell
+        value: a solid black wall block and a white path block whose top and
+        left edges are gray, matching the outlined rectangles of draw_cell
+    """
+    tiles = np.empty((2, cell_size, cell_size, 3), dtype=np.uint8)
+    tiles[0] = _WALL_RGB
+    tiles[1] = _PATH_RGB
+    tiles[1, 0, :] = _OUTLINE_RGB
+    tiles[1, :, 0] = _OUTLINE_RGB
+    return tiles
+
+
+@njit('void(uint8[:, ::1], int64, int64, int64)', cache=True)
+def _carve(maze, h, w, seed):
+    """
+    Carve a complete maze into a zeroed uint8 grid using randomized
+    depth-first search, written so it can be compiled with numba.
+    
+    Args:
+        maze (np.ndarray): (h, w) uint8 grid of cell flags, all walls (0) on
+            entry, modified in place
+        h (int): Grid height in cells (odd)
+        w (int): Grid width in cells (odd)
+        seed (int): Seed for the random generator
+        
+    Uses an explicit int32 stack instead of recursion and visits the rows
+    of _DIRS in np.random.permutation order at each step, since
+    random.shuffle on Python lists is not available in compiled code.
+    The explicit signature compiles it once, for every maze size, and lets
+    numba keep it in the on-disk cache.
+    """
+    np.random.seed(seed)
+    stack = np.empty((h * w, 2), dtype=np.int32)
+    
+    # Start from a random cell with odd coordinates
+    x = 2 * np.random.randint(0, (w - 1) // 2) + 1
+    y = 2 * np.random.randint(0, (h - 1) // 2) + 1
+    maze[y, x] = _CARVED
+    stack[0, 0] = x
+    stack[0, 1] = y
+    top = 1
+    
+    while top > 0:
+        x = stack[top - 1, 0]
+        y = stack[top - 1, 1]
+        
+        moved = False
+        for i in np.random.permutation(4):
+            dx = _DIRS[i, 0]
+            dy = _DIRS[i, 1]
+            new_x = x + dx
+            new_y = y + dy
+            if 0 <= new_x < w and 0 <= new_y < h and maze[new_y, new_x] == 0:
+                # Carve through the wall and visit the new cell next
+                maze[y + dy // 2, x + dx // 2] = _PATH
+                maze[new_y, new_x] = _CARVED
+                stack[top, 0] = new_x
+                stack[top, 1] = new_y
+                top += 1
+                moved = True
+                break
+        
+        if not moved:
+            # No unvisited neighbours: backtrack
+            top -= 1
+
 
 class MazeGenerator:
     """
@@ -39,8 +151,25 @@ class MazeGenerator:
         self.width = width
         self.height = height
         self.cell_size = cell_size
-        self.maze = []          # 2D array representing the maze (0=wall, 1=path)
-        self.visited = []       # 2D array for tracking visited cells during animation
+        self.maze = None        # uint8 grid of cell flags (bit 0 = path, bit 1 = visited)
+        
+        # Animation state: the search stack and the pending after() callback
+        self._stack = []
+        self._after_id = None
+        self._step_delay = 5    # milliseconds between animation steps
+        
+        # Private generator for start cells and direction shuffles
+        self._rng = random.Random()
+        
+        # PhotoImage holding the rendered maze; kept so Tk does not drop it
+        self._maze_image = None
+        
+        # Canvas item id of the overlay rectangle drawn on each cell (0 = none)
+        self._rect_ids = None
+        
+        # Pixel coordinates of the cell edges along x and y, used by draw_cell
+        self._xs = None
+        self._ys = None
         
         # Initialize GUI components
         self.root = tk.Tk()
@@ -105,7 +234,9 @@ class MazeGenerator:
         button_row1 = Frame(button_frame, bg='lightgray')
         button_row1.pack(side='top', pady=2)
         
-        Button(button_row1, text="Generate Maze", command=self.generate_maze, 
+        # The compiled carver is only faster when numba is available
+        generate = self.generate_fast if _HAVE_NUMBA else self.generate_maze
+        Button(button_row1, text="Generate Maze", command=generate, 
                bg='lightblue', font=('Arial', 9, 'bold'), width=12, height=1).pack(side='left', padx=3)
         
         Button(button_row1, text="Clear", command=self.clear_maze, 
@@ -200,17 +331,20 @@ class MazeGenerator:
         
     def initialize_maze(self):
         """
-        Initialize the maze grid and visited tracking array.
+        Initialize the maze grid.
         
-        Creates two 2D arrays:
-        - maze: Grid where 0 represents walls and 1 represents paths
-        - visited: Boolean array for tracking visited cells during animation
+        Creates one (height, width) uint8 NumPy array holding the state of
+        each cell as bit flags: bit 0 (_PATH) is set on paths, bit 1
+        (_VISITED) on cells reached by the search. A cell with no flags set
+        is an unvisited wall; maze & 1 gives the 0 = wall, 1 = path view.
+        
+        Any animation still in progress is stopped first, since its pending
+        steps would otherwise keep carving into the new grid.
         """
-        # Create maze grid (0 = wall, 1 = path)
-        self.maze = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        self._cancel_animation()
         
-        # Create visited array for tracking
-        self.visited = [[False for _ in range(self.width)] for _ in range(self.height)]
+        # Create maze grid (all walls, nothing visited)
+        self.maze = np.zeros((self.height, self.width), dtype=np.uint8)
         
     def generate_maze(self):
         """
@@ -219,7 +353,7 @@ class MazeGenerator:
         This method:
         1. Ensures maze dimensions are odd for proper structure
         2. Selects a random starting position
-        3. Calls the recursive backtracking algorithm
+        3. Runs the backtracking algorithm
         4. Draws the final maze on the canvas
         
         The algorithm creates a perfect maze with exactly one path between any two points.
@@ -233,8 +367,8 @@ class MazeGenerator:
             self.height += 1
             
         # Start from a random cell (must be odd coordinates)
-        start_x = random.randint(1, self.width - 2)
-        start_y = random.randint(1, self.height - 2)
+        start_x = self._rng.randint(1, self.width - 2)
+        start_y = self._rng.randint(1, self.height - 2)
         
         if start_x % 2 == 0:
             start_x = (start_x + 1) % (self.width - 1)
@@ -242,7 +376,44 @@ class MazeGenerator:
             start_y = (start_y + 1) % (self.height - 1)
             
         # Generate the maze
-        self._recursive_backtrack(start_x, start_y)
+        self._iterative_backtrack(start_x, start_y)
+        
+        # Draw the final maze
+        self.draw_maze()
+        
+    def generate_fast(self, seed=None):
+        """
+        Generate a complete maze with the compiled carving kernel.
+        
+        Produces the same kind of perfect maze as generate_maze, but carves
+        the whole grid in a single call to the numba-compiled _carve, then
+        draws the result once. Without numba, the interpreted backtracker
+        runs on a local generator seeded with seed instead, since _carve
+        would reseed NumPy's global random state.
+        
+        Args:
+            seed (int, optional): Seed for the carving kernel; a random seed
+                is drawn when omitted
+        """
+        # Ensure dimensions are odd for proper maze structure
+        if self.width % 2 == 0:
+            self.width += 1
+        if self.height % 2 == 0:
+            self.height += 1
+            
+        self.initialize_maze()
+        
+        if seed is None:
+            seed = self._rng.randrange(2 ** 31)
+        
+        if _HAVE_NUMBA:
+            _carve(self.maze, self.height, self.width, seed)
+        else:
+            # Start from a random cell with odd coordinates
+            rng = random.Random(seed)
+            start_x = 2 * rng.randrange((self.width - 1) // 2) + 1
+            start_y = 2 * rng.randrange((self.height - 1) // 2) + 1
+            self._iterative_backtrack(start_x, start_y, rng)
         
         # Draw the final maze
         self.draw_maze()
@@ -255,7 +426,8 @@ class MazeGenerator:
         1. Drawing the initial maze with all black walls
         2. Showing the current cell being explored in light blue
         3. Displaying carved paths in white
-        4. Using small delays to make the process visible
+        4. Scheduling one search step at a time with root.after, so Tk keeps
+           handling events and redraws between steps
         
         Perfect for understanding how the recursive backtracking algorithm works.
         """
@@ -268,8 +440,8 @@ class MazeGenerator:
             self.height += 1
             
         # Start from a random cell
-        start_x = random.randint(1, self.width - 2)
-        start_y = random.randint(1, self.height - 2)
+        start_x = self._rng.randint(1, self.width - 2)
+        start_y = self._rng.randint(1, self.height - 2)
         
         if start_x % 2 == 0:
             start_x = (start_x + 1) % (self.width - 1)
@@ -280,10 +452,12 @@ class MazeGenerator:
         self.canvas.delete("all")
         self.draw_maze()  # Draw all walls as black first
         
-        # Animate the generation
-        self._recursive_backtrack_animated(start_x, start_y)
+        # Animate the generation: the Tk event loop runs the steps
+        item = self._visit_animated(start_x, start_y)
+        self._stack = [(start_x, start_y, self._shuffled_directions(), item)]
+        self._after_id = self.root.after(self._step_delay, self._step)
         
-    def _recursive_backtrack(self, x, y):
+    def _iterative_backtrack(self, x, y, rng=None):
         """
         Core recursive backtracking algorithm for maze generation.
         
@@ -291,110 +465,172 @@ class MazeGenerator:
         1. Marking the current cell as a path
         2. Randomly trying all four directions (right, down, left, up)
         3. For each valid direction, carving through the wall to the next cell
-        4. Recursively exploring the new cell
-        5. Automatically backtracking when no more directions are available
+        4. Exploring the new cell before trying the remaining directions
+        5. Backtracking when no more directions are available
         
         Args:
-            x (int): Current cell's x-coordinate
-            y (int): Current cell's y-coordinate
+            x (int): Starting cell's x-coordinate
+            y (int): Starting cell's y-coordinate
+            rng (random.Random, optional): Generator for the direction
+                shuffles; defaults to the instance generator
             
+        The depth-first search runs on an explicit stack instead of Python
+        recursion, so maze size is not limited by the recursion limit. Each
+        stack entry keeps its own iterator over the shuffled directions, which
+        visits cells in exactly the same order as the recursive formulation.
         The algorithm ensures every cell is visited exactly once, creating
         a perfect maze with no cycles and exactly one path between any two points.
         """
-        # Mark current cell as path
-        self.maze[y][x] = 1
+        # Mark starting cell as path
+        self.maze[y, x] = _CARVED
+        stack = [(x, y, self._shuffled_directions(rng))]
         
-        # Define possible directions (dx, dy) - moving 2 cells at a time
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]  # right, down, left, up
-        random.shuffle(directions)
-        
-        # Try each direction
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
+        while stack:
+            x, y, directions = stack[-1]
             
-            # Check if new position is valid and unvisited
-            if (0 <= new_x < self.width and 
-                0 <= new_y < self.height and 
-                self.maze[new_y][new_x] == 0):
-                
-                # Carve path through the wall between current and new cell
-                wall_x, wall_y = x + dx // 2, y + dy // 2
-                self.maze[wall_y][wall_x] = 1
+            # Try the next remaining direction of the cell on top of the stack
+            for dx, dy in directions:
+                new_x, new_y = x + dx, y + dy
                 
-                # Recursively visit the new cell
-                self._recursive_backtrack(new_x, new_y)
+                # Check if new position is valid and unvisited
+                if (0 <= new_x < self.width and 
+                    0 <= new_y < self.height and 
+                    self.maze[new_y, new_x] == 0):
+                    
+                    # Carve path through the wall between current and new cell
+                    wall_x, wall_y = x + dx // 2, y + dy // 2
+                    self.maze[wall_y, wall_x] = _PATH
+                    
+                    # Visit the new cell next
+                    self.maze[new_y, new_x] = _CARVED
+                    stack.append((new_x, new_y, self._shuffled_directions(rng)))
+                    break
+            else:
+                # No directions left: backtrack
+                stack.pop()
                 
-    def _recursive_backtrack_animated(self, x, y):
+    def _step(self):
         """
-        Animated version of the recursive backtracking algorithm.
+        Advance the animated backtracking search by one move.
         
-        This method provides the same functionality as _recursive_backtrack but
-        with visual feedback during the generation process:
+        This is the animated counterpart of _iterative_backtrack, unrolled
+        into a state machine over self._stack so that each call performs a
+        single move with visual feedback:
         - Current cell being explored: light blue
         - Carved paths: white
         - Unvisited walls: black
         
-        Args:
-            x (int): Current cell's x-coordinate
-            y (int): Current cell's y-coordinate
-            
-        The animation helps visualize how the algorithm explores and backtracks
-        through the maze, making it easier to understand the process.
+        A move either carves into one new neighbour of the cell on top of the
+        stack or, when none is left, finalizes that cell and backtracks. Each
+        stack entry keeps the id of the cell's highlight rectangle, so
+        finalizing only recolours that item. The
+        next move is scheduled with root.after instead of sleeping, so the
+        window stays responsive and Tk redraws the canvas while it waits.
         """
-        # Mark current cell as path
-        self.maze[y][x] = 1
-        self.visited[y][x] = True
-        
-        # Draw current cell
-        self.draw_cell(x, y, 'lightblue')
-        self.root.update()
-        time.sleep(0.01)  # Small delay for animation
-        
-        # Define possible directions
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-        random.shuffle(directions)
+        x, y, directions, item = self._stack[-1]
         
         for dx, dy in directions:
             new_x, new_y = x + dx, y + dy
             
             if (0 <= new_x < self.width and 
                 0 <= new_y < self.height and 
-                self.maze[new_y][new_x] == 0):
+                self.maze[new_y, new_x] == 0):
                 
                 # Carve path through wall
                 wall_x, wall_y = x + dx // 2, y + dy // 2
-                self.maze[wall_y][wall_x] = 1
+                self.maze[wall_y, wall_x] = _PATH
                 
                 # Draw the wall being carved
                 self.draw_cell(wall_x, wall_y, 'white')
-                self.root.update()
-                time.sleep(0.005)
-                
-                # Recursively visit new cell
-                self._recursive_backtrack_animated(new_x, new_y)
                 
-        # Mark as visited and draw final path
-        self.draw_cell(x, y, 'white')
-        self.root.update()
+                # Visit the new cell next
+                new_item = self._visit_animated(new_x, new_y)
+                self._stack.append((new_x, new_y, self._shuffled_directions(), new_item))
+                break
+        else:
+            # Turn the cell's highlight into final path, then backtrack
+            self.canvas.itemconfig(item, fill='white')
+            self._stack.pop()
+        
+        if self._stack:
+            self._after_id = self.root.after(self._step_delay, self._step)
+        else:
+            self._after_id = None
+            
+    def _cancel_animation(self):
+        """
+        Stop a running animation by dropping its scheduled step and stack.
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._stack = []
+        
+    def _visit_animated(self, x, y):
+        """
+        Mark a cell as part of the path and highlight it as the current cell.
+        
+        Args:
+            x (int): Cell's x-coordinate
+            y (int): Cell's y-coordinate
+            
+        Returns:
+            int: Canvas item id of the cell's highlight rectangle
+        """
+        self.maze[y, x] = _CARVED
+        
+        # Draw current cell
+        return self.draw_cell(x, y, 'lightblue')
+        
+    def _shuffled_directions(self, rng=None):
+        """
+        Return an iterator over the four carving directions in random order.
+        
+        Args:
+            rng (random.Random, optional): Generator to draw from; defaults
+                to the instance generator
+        
+        Directions (dx, dy) move 2 cells at a time: right, down, left, up.
+        Picks one of the 24 precomputed orderings in _PERMS4 with a single
+        call on the generator instead of shuffling a fresh list.
+        """
+        if rng is None:
+            rng = self._rng
+        return iter(_PERMS4[rng.randrange(24)])
         
     def draw_maze(self):
         """
         Draw the complete maze on the canvas.
         
         This method renders the current state of the maze grid:
-        - Walls (value 0): drawn in black
-        - Paths (value 1): drawn in white with gray outlines
+        - Walls (path bit clear): drawn in black
+        - Paths (path bit set): drawn in white with gray outlines
         
-        Clears the canvas first, then draws each cell according to its value.
+        Clears the canvas first, then renders the whole grid into a single
+        image: each cell's path bit selects a cell_size pixel block, and the blocks
+        are laid out with one NumPy reshape. The image is placed with one
+        canvas call instead of creating a rectangle per cell.
         """
         self.canvas.delete("all")
+        # Clearing the canvas invalidates every cached overlay rectangle
+        self._rect_ids = np.zeros((self.height, self.width), dtype=np.int64)
+        
+        cs = self.cell_size
+        
+        # Cell edge coordinates for the current size; plain lists index faster
+        # than NumPy arrays from Python code
+        self._xs = (np.arange(self.width + 1) * cs).tolist()
+        self._ys = (np.arange(self.height + 1) * cs).tolist()
+        img_w, img_h = self.width * cs, self.height * cs
         
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.maze[y][x] == 0:  # Wall
-                    self.draw_cell(x, y, 'black')
-                else:  # Path
-                    self.draw_cell(x, y, 'white')
+        # (h, w, cs, cs, 3) blocks -> (h * cs, w * cs, 3) pixel rows
+        pixels = _cell_tiles(cs)[self.maze & _PATH]
+        pixels = pixels.transpose(0, 2, 1, 3, 4).reshape(img_h, img_w, 3)
+        
+        # Keep a reference: Tk does not hold on to the PhotoImage itself
+        ppm = f"P6 {img_w} {img_h} 255 ".encode() + pixels.tobytes()
+        self._maze_image = tk.PhotoImage(width=img_w, height=img_h, data=ppm, format='PPM')
+        self.canvas.create_image(0, 0, anchor='nw', image=self._maze_image)
                     
     def draw_cell(self, x, y, color):
         """
@@ -405,19 +641,28 @@ class MazeGenerator:
             y (int): Y-coordinate of the cell
             color (str): Color to fill the cell with
             
+        Returns:
+            int: Canvas item id of the cell's rectangle
+            
         Special handling for black cells (walls) to ensure they have
         solid black fill and outline for better visibility.
-        """
-        x1 = x * self.cell_size
-        y1 = y * self.cell_size
-        x2 = x1 + self.cell_size
-        y2 = y1 + self.cell_size
         
+        Each cell gets at most one rectangle: the first draw creates it and
+        caches its item id, later draws recolour it with itemconfig instead
+        of stacking another item on the canvas.
+        """
         # Keep walls black, paths white
-        if color == 'black':
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill='black', outline='black')
-        else:
-            self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='gray')
+        outline = 'black' if color == 'black' else 'gray'
+        
+        item = int(self._rect_ids[y, x])
+        if item:
+            self.canvas.itemconfig(item, fill=color, outline=outline)
+            return item
+        
+        xs, ys = self._xs, self._ys
+        item = self.canvas.create_rectangle(xs[x], ys[y], xs[x + 1], ys[y + 1], fill=color, outline=outline)
+        self._rect_ids[y, x] = item
+        return item
         
     def clear_maze(self):
         """
@@ -436,11 +681,15 @@ class MazeGenerator:
         Print the current maze to the console for debugging purposes.
         
         Uses '#' to represent walls and spaces to represent paths,
-        providing a text-based view of the maze structure.
+        providing a text-based view of the maze structure. The grid bytes
+        are mapped to characters in one bytes.translate pass, then split
+        into rows.
         """
+        buf = self.maze.tobytes().translate(_PRINT_TABLE)
+        w = self.maze.shape[1]
+        
         print("Maze:")
-        for row in self.maze:
-            print(''.join(['#' if cell == 0 else ' ' for cell in row]))
+        print(b'\n'.join(buf[i:i + w] for i in range(0, len(buf), w)).decode())
             
     def run(self):
         """